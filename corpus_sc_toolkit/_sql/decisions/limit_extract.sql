@@ -88,3 +88,6 @@ FROM
   ON meta.decision_id = caso.id
 WHERE
   meta.notice = 0
+  AND caso.category <> ''
+  AND caso.serial <> ''
+  AND caso.date <> ''
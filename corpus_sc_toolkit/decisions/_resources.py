@@ -1,9 +1,36 @@
+import hashlib
+import itertools
+import os
+import tempfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
+import boto3
+import yaml
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from loguru import logger
 from start_sdk.cf_r2 import StorageUtils
 
+from corpus_sc_toolkit.utils import SafeLoader
+
 DECISION_TEMP_FOLDER = Path(__file__).parent / "_tmp"
 DECISION_TEMP_FOLDER.mkdir(exist_ok=True)
+DECISION_CACHE_FOLDER: Path | None = (
+    None
+    if os.environ.get("CORPUS_SC_TOOLKIT_NO_CACHE")
+    else Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "corpus-sc-toolkit"
+    / "decisions"
+)
+"""User cache directory of objects downloaded by `get_object_bytes()`,
+created on first write. Caching is skipped when `None`, e.g. when the
+`CORPUS_SC_TOOLKIT_NO_CACHE` environment variable is set."""
+
+DECISION_CACHE_MAX_ITEMS = 4096
+"""Upper bound on cached objects; the least recently used are pruned."""
 
 DECISION_BUCKET_NAME = "sc-decisions"
 decision_storage = StorageUtils(
@@ -12,4 +39,170 @@ decision_storage = StorageUtils(
 meta = decision_storage.resource.meta
 if not meta:
     raise Exception("Bad bucket.")
-DECISION_CLIENT = meta.client
+
+DECISION_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"mode": "adaptive", "max_attempts": 10},
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=30,
+)
+"""Larger connection pool, adaptive retries (jittered backoff on 503 SlowDown)
+and TCP keepalive so that concurrent list / get calls reuse connections."""
+
+DECISION_CLIENT = boto3.client(
+    "s3",
+    endpoint_url=decision_storage.endpoint_url,
+    aws_access_key_id=decision_storage.r2_access_key,
+    aws_secret_access_key=decision_storage.r2_secret_key,
+    region_name=decision_storage.r2_region,
+    config=DECISION_CLIENT_CONFIG,
+)
+
+NOT_FOUND_CODES = ("404", "NoSuchKey", "NotFound")
+NOT_MODIFIED_CODE = "304"
+
+
+def is_missing_key(err: ClientError) -> bool:
+    """Whether the error raised by `DECISION_CLIENT` implies an absent key,
+    as opposed to a throttled / failed request which should propagate."""
+    return err.response.get("Error", {}).get("Code") in NOT_FOUND_CODES
+
+
+_cache_writes = itertools.count(1)
+
+
+def prune_cache(max_items: int = DECISION_CACHE_MAX_ITEMS):
+    """Keep only the `max_items` most recently used objects, i.e. by the
+    modification time of each cached body, of `DECISION_CACHE_FOLDER`."""
+    if not DECISION_CACHE_FOLDER or not DECISION_CACHE_FOLDER.exists():
+        return
+    bodies = [
+        entry
+        for entry in os.scandir(DECISION_CACHE_FOLDER)
+        if entry.is_file()
+        and not entry.name.startswith(".")  # partial writes, see below
+        and not entry.name.endswith(".etag")
+    ]
+    if len(bodies) <= max_items:
+        return
+    bodies.sort(key=lambda entry: entry.stat().st_mtime_ns, reverse=True)
+    for entry in bodies[max_items:]:
+        Path(entry.path).unlink(missing_ok=True)
+        Path(f"{entry.path}.etag").unlink(missing_ok=True)
+
+
+def replace_file(target: Path, data: bytes):
+    """Write `data` to a hidden temp file in the folder of `target` and then
+    rename it into place, so that `target` is never left half-written."""
+    fd, temp_name = tempfile.mkstemp(dir=target.parent, prefix=".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_name, target)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def get_object(args: dict) -> bytes | None:
+    """Body of the object described by `args`, `None` if the key is absent."""
+    try:
+        return DECISION_CLIENT.get_object(**args)["Body"].read()
+    except ClientError as e:
+        if is_missing_key(e):
+            return None
+        raise
+
+
+def get_object_bytes(key: str) -> bytes | None:
+    """Download the `key` from R2, reusing a local copy when unchanged.
+
+    Each downloaded object is kept in `DECISION_CACHE_FOLDER` alongside its
+    ETag. On a later call, the ETag is sent as `IfNoneMatch` so that R2
+    answers with a bodiless 304 for an unchanged object and the local copy
+    is read instead; this costs the same single request as a plain GET.
+    The folder is bounded to `DECISION_CACHE_MAX_ITEMS` objects.
+
+    The body is replaced before its ETag, so a cached ETag always refers to
+    a complete body. A copy removed by `prune_cache()` from another thread
+    is fetched again with an unconditional GET."""
+    args = {"Bucket": DECISION_BUCKET_NAME, "Key": key}
+    if not (folder := DECISION_CACHE_FOLDER):
+        return get_object(args)
+    name = hashlib.sha256(key.encode()).hexdigest()
+    body_file = folder / name
+    etag_file = folder / f"{name}.etag"
+    try:
+        args["IfNoneMatch"] = etag_file.read_text()
+    except FileNotFoundError:  # not cached yet, or pruned
+        pass
+    try:
+        obj = DECISION_CLIENT.get_object(**args)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") != NOT_MODIFIED_CODE:
+            if is_missing_key(e):
+                return None
+            raise
+        try:
+            os.utime(body_file)  # marks the object as recently used
+            return body_file.read_bytes()
+        except FileNotFoundError:  # pruned by another thread
+            args.pop("IfNoneMatch")
+            return get_object(args)
+    content = obj["Body"].read()
+    try:
+        folder.mkdir(parents=True, exist_ok=True)
+        replace_file(body_file, content)
+        replace_file(etag_file, obj["ETag"].encode())
+    except OSError as e:  # e.g. a read-only home; serve without caching
+        logger.warning(f"Could not cache {key=}; see {e=}")
+        return content
+    if next(_cache_writes) % 256 == 0:  # amortize the directory scan
+        prune_cache()
+    return content
+
+
+def upload_to_storage(file_like: str | Path, loc: str, args: dict = {}):
+    """Unlike `decision_storage.upload()`, which builds a boto3 resource from
+    a shared session on every call, upload through `DECISION_CLIENT` since a
+    boto3 client, unlike a session, can be shared across threads."""
+    DECISION_CLIENT.upload_file(
+        Filename=str(file_like),
+        Bucket=DECISION_BUCKET_NAME,
+        Key=loc,
+        ExtraArgs=args,
+    )
+
+
+def restore_yaml(key: str) -> dict[str, Any] | None:
+    """Unlike `decision_storage.restore_temp_yaml()`, read the `key` from R2
+    into memory rather than through a shared temp file so that it can be
+    called from multiple threads."""
+    if (content := get_object_bytes(key)) is None:
+        return None
+    return yaml.load(content, Loader=SafeLoader)
+
+
+def list_keys(bucket: str = DECISION_BUCKET_NAME) -> Iterator[str]:
+    """All keys of the `bucket`. The top-level prefixes, i.e. the docket
+    categories `gr/`, `am/`, etc., are listed first so that each can be
+    paginated through `list_objects_v2` in its own thread rather than
+    walking the entire bucket 1000 keys at a time in a single thread."""
+    paginator = DECISION_CLIENT.get_paginator("list_objects_v2")
+
+    def keys_under(prefix: str) -> list[str]:
+        pages = paginator.paginate(Bucket=bucket, Prefix=prefix)
+        return [
+            obj["Key"] for page in pages for obj in page.get("Contents", [])
+        ]
+
+    prefixes = []
+    for page in paginator.paginate(Bucket=bucket, Delimiter="/"):
+        yield from (obj["Key"] for obj in page.get("Contents", []))
+        prefixes.extend(p["Prefix"] for p in page.get("CommonPrefixes", []))
+    if not prefixes:
+        return
+    with ThreadPoolExecutor(max_workers=min(16, len(prefixes))) as executor:
+        for keys in executor.map(keys_under, prefixes):
+            yield from keys
@@ -1,5 +1,7 @@
 import abc
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter
 from sqlite3 import IntegrityError
 from typing import Self
 
@@ -13,7 +15,9 @@ from sqlpyd import TableConfig
 from statute_trees import MentionedStatute
 
 from corpus_sc_toolkit.store import StorageToDatabaseConfiguration
+from corpus_sc_toolkit.utils import SafeLoader
 
+from ._resources import list_keys
 from .decision_fields import DecisionFields
 from .decision_fields_via_html import DETAILS_KEY, DecisionHTML
 from .decision_fields_via_pdf import PDF_KEY, DecisionPDF
@@ -56,11 +60,13 @@ class DecisionRow(DecisionFields, TableConfig):
     @classmethod
     def from_key(cls, key: str) -> Self | None:
         """Expects full key inclusive of whether `details.yaml` / `pdf.yaml`
-        to retrieve an instance of `DecisionRow` from r2, if available."""
-        if key.endswith(DETAILS_KEY):
-            return cls(**DecisionHTML.get_from_storage(key).dict())
-        elif key.endswith(PDF_KEY):
-            return cls(**DecisionPDF.get_from_storage(key).dict())
+        to retrieve an instance of `DecisionRow` from r2, if available.
+
+        The restored data is validated directly as a `DecisionRow` rather than
+        as a `DecisionHTML` / `DecisionPDF` which would then be exported via
+        `.dict()`, opinions included, only to be validated a second time."""
+        if key.endswith((DETAILS_KEY, PDF_KEY)):
+            return cls.get_from_storage(key)
         return None
 
     @classmethod
@@ -193,7 +199,9 @@ class ConfigDecisions(StorageToDatabaseConfiguration):
     def set_tables(self) -> Database:
         logger.info("Ensure tables are created.")
         try:
-            justices = yaml.safe_load(get_justices_file().read_bytes())
+            justices = yaml.load(
+                get_justices_file().read_bytes(), Loader=SafeLoader
+            )
             self.conn.add_records(Justice, justices)
         except IntegrityError:
             ...  # already existing table because of prior addition
@@ -255,10 +263,6 @@ class ConfigDecisions(StorageToDatabaseConfiguration):
                 kls=OpinionRow,
                 item=op.dict(),
             )
-            self.conn.add_cleaned_records(
-                kls=SegmentRow,
-                items=op.segments,
-            )
             base_op = {"opinion_id": op.id, "decision_id": op.decision_id}
             if op.tags:
                 self.conn.add_records(
@@ -274,45 +278,79 @@ class ConfigDecisions(StorageToDatabaseConfiguration):
                 kls=CitationInOpinion,
                 items=[base_op | cite.dict() for cite in op.citations],
             )
+
+        # segments of all opinions in one statement, one commit per decision
+        self.add_segments([seg for op in row.opinions for seg in op.segments])
         return row.id
 
+    def add_segments(self, segments: list[OpinionSegment]) -> None:
+        """Bulk insert of a decision's segments with a single `executemany`
+        rather than a model conversion per segment."""
+        if not segments:
+            return
+        table = self.conn.table(SegmentRow)
+        cols = tuple(OpinionSegment.__fields__)  # the row mirrors the model
+        sql = (
+            f"insert into [{table.name}] ({', '.join(f'[{c}]' for c in cols)})"
+            f" values ({', '.join('?' * len(cols))})"
+        )
+        rows = map(attrgetter(*cols), segments)
+        with self.conn.db.conn:
+            self.conn.db.conn.executemany(sql, rows)
+
+    def add_from_storage(
+        self, get_row: Callable[[str], DecisionRow | None], keys: list[str]
+    ) -> None:
+        """Rows are downloaded from storage via `get_row()` in a thread pool,
+        a chunk of `keys` at a time, while each completed row is added to the
+        database in the calling thread."""
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            for idx in range(0, len(keys), 64):
+                futures = {
+                    executor.submit(get_row, key): key
+                    for key in keys[idx : idx + 64]
+                }
+                for future in as_completed(futures):
+                    try:
+                        if row := future.result():
+                            if row_added := self.add_row(row):
+                                logger.success(f"{row_added=}")
+                    except Exception as e:
+                        logger.error(f"Bad {futures[future]}; {e=}")
+
     def add_rows(self):
         self.set_tables()
-        if decision_prefixes := self.storage.all_items():
-            for item in decision_prefixes:
-                try:
-                    if row := DecisionRow.from_key(item["Key"]):
-                        if row_added := self.add_row(row):
-                            logger.success(f"{row_added=}")
-                except Exception as e:
-                    logger.error(f"Bad {id}; {e=}")
+        suffixes = (DETAILS_KEY, PDF_KEY)  # other keys yield no row
+        keys = list_keys(self.storage.name)
+        keys = [key for key in keys if key.endswith(suffixes)]
+        self.add_from_storage(DecisionRow.from_key, keys)
 
     def get_db_ids(self) -> Iterator[str]:
         table = self.conn.db[DecisionRow.__tablename__]
-        for row in table.rows_where(select="id"):
-            yield row["id"]
+        if table.exists():  # tuples from the raw cursor, no row dicts
+            sql = f"select id from [{table.name}]"
+            for (idx,) in self.conn.db.conn.execute(sql):
+                yield idx
+
+    def get_r2_keys(self) -> dict[str, str]:
+        """From a single pass over the listing, map each decision id to its
+        `details.yaml` key or, absent one, its `pdf.yaml` key. This is the
+        same preference as `DecisionRow.from_prefix()` without having to
+        probe R2 for each suffix."""
+        keys: dict[str, str] = {}
+        for key in list_keys(self.storage.name):
+            prefix, _, suffix = key.rpartition("/")
+            if prefix and suffix == DETAILS_KEY:
+                keys[prefix] = key
+            elif prefix and suffix == PDF_KEY:
+                keys.setdefault(prefix, key)
+        return {prefix.replace("/", "."): key for prefix, key in keys.items()}
 
     def get_r2_ids(self) -> Iterator[str]:
-        if objs := self.storage.all_items():
-            detail_keys = [  # Get unique prefixes containing details
-                detail["Key"].removesuffix(f"/{DETAILS_KEY}")
-                for detail in self.storage.filter_content(DETAILS_KEY, objs)
-            ]
-            pdf_keys = [  # Get unique suffixes containing pdfs
-                pdf["Key"].removesuffix(f"/{PDF_KEY}")
-                for pdf in self.storage.filter_content(PDF_KEY, objs)
-            ]
-            for key in set(detail_keys + pdf_keys):
-                yield key.replace("/", ".")
+        yield from self.get_r2_keys()
 
     def add_missing_r2_ids(self):
-        r2_ids = set(self.get_r2_ids())
+        r2_keys = self.get_r2_keys()
         db_ids = set(self.get_db_ids())
-        for id in r2_ids.difference(db_ids):
-            key = id.replace(".", "/")
-            try:
-                if row := DecisionRow.from_prefix(key):
-                    if added := self.add_row(row):
-                        logger.success(f"Added: {id=} {added=}")
-            except Exception as e:
-                logger.error(f"Bad {id}; {e=}")
+        keys = [key for idx, key in r2_keys.items() if idx not in db_ids]
+        self.add_from_storage(DecisionRow.from_key, keys)
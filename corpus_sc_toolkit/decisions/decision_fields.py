@@ -1,11 +1,23 @@
 import datetime
+from collections.abc import Iterator
 from typing import Self
 
+import yaml
+from botocore.exceptions import ClientError
 from citation_utils import Citation
 from loguru import logger
 from pydantic import BaseModel, Field, root_validator
 
-from ._resources import decision_storage
+from corpus_sc_toolkit.utils import SafeDumper
+
+from ._resources import (
+    DECISION_BUCKET_NAME,
+    DECISION_CLIENT,
+    decision_storage,
+    is_missing_key,
+    list_keys,
+    restore_yaml,
+)
 from .decision_opinions import DecisionOpinion
 from .fields import CourtComposition, DecisionCategory
 
@@ -104,6 +116,33 @@ class DecisionFields(BaseModel):
             "has_pdf": self.is_pdf,
         }
 
+    @classmethod
+    def key_in_storage(cls, dated_prefix: str, suffix: str) -> str | None:
+        """Is `<dated_prefix>/<suffix>`, where suffix is either `details.yaml`
+        or `pdf.yaml`, present in R2? If so, return the key. Only the headers
+        are requested since the body of the object is not needed."""
+        if suffix not in ("details.yaml", "pdf.yaml"):
+            raise Exception("Invalid key suffix.")
+        key = f"{dated_prefix}/{suffix}"
+        try:
+            DECISION_CLIENT.head_object(Bucket=DECISION_BUCKET_NAME, Key=key)
+            return key
+        except ClientError as e:
+            if is_missing_key(e):
+                return None
+            raise
+
+    @classmethod
+    def prefixes_in_storage(cls, suffix: str) -> Iterator[str]:
+        """Keys in R2 ending with `/<suffix>`, where suffix is either
+        `details.yaml` or `pdf.yaml`."""
+        if suffix not in ("details.yaml", "pdf.yaml"):
+            raise Exception("Invalid key suffix.")
+        ending = f"/{suffix}"
+        for key in list_keys():
+            if key.endswith(ending):
+                yield key
+
     def put_in_storage(self, suffix: str):
         """Puts Pydantic exported data dict to `details.yaml` or `pdf.yaml` in
         R2, depending on the value of `suffix`."""
@@ -115,13 +154,22 @@ class DecisionFields(BaseModel):
         # Prepare instance values
         output_data = self.dict(exclude_none=True)
         remote_loc = f"{self.prefix}/{suffix}"
-        temp_file = decision_storage.make_temp_yaml_path_from_data(output_data)
-        args = decision_storage.set_extra_meta(self.storage_meta)
+        body = yaml.dump(  # in memory, same output as safe_dump
+            output_data,
+            Dumper=SafeDumper,
+            sort_keys=True,
+            default_flow_style=False,
+            encoding="utf-8",
+        )
 
         # Put proper
         logger.info(f"Uploading file to {remote_loc=}")
-        decision_storage.upload(file_like=temp_file, loc=remote_loc, args=args)
-        temp_file.unlink()
+        DECISION_CLIENT.put_object(
+            Bucket=DECISION_BUCKET_NAME,
+            Key=remote_loc,
+            Body=body,
+            **decision_storage.set_extra_meta(self.storage_meta),
+        )
 
     @classmethod
     def get_from_storage(cls, prefix: str) -> Self:
@@ -134,7 +182,7 @@ class DecisionFields(BaseModel):
             raise Exception("Bad path for DecisionFields base class.")
 
         # Get proper
-        data = decision_storage.restore_temp_yaml(prefix)
+        data = restore_yaml(prefix)
         if not data:
             raise Exception(f"Could not originate {prefix=}")
 
@@ -4,11 +4,13 @@ from pathlib import Path
 import yaml
 from citation_utils import Citation
 from loguru import logger
-from markdownify import markdownify
+from markdownify import MarkdownConverter
 from pydantic import Field
 from sqlite_utils import Database
 
-from ._resources import DECISION_BUCKET_NAME, DECISION_CLIENT, decision_storage
+from corpus_sc_toolkit.utils import SafeLoader
+
+from ._resources import upload_to_storage
 from .decision_fields import DecisionFields
 from .decision_opinions import DecisionOpinion
 from .fields import (
@@ -21,28 +23,21 @@ from .justice import CandidateJustice
 DETAILS_KEY = "details.yaml"
 """This suffix is uploaded / retrieved from R2 storage based on `DecisionHTML`."""
 
+FALLO_CONVERTER = MarkdownConverter()
+"""Reused across `fallo.html` files instead of a new converter per call."""
+
 
 class DecisionHTML(DecisionFields):
     home_html: Path | None = Field(default=None, exclude=True)
 
     @classmethod
     def get_key(cls, dated_prefix: str) -> str | None:
-        """Is suffix `details.yaml` present in result of `cls.iter_dockets()`?"""
-        key = f"{dated_prefix}/{DETAILS_KEY}"
-        try:
-            DECISION_CLIENT.get_object(Bucket=DECISION_BUCKET_NAME, Key=key)
-            return key
-        except Exception:
-            return None
+        """Is suffix `details.yaml` present in R2 for `dated_prefix`?"""
+        return cls.key_in_storage(dated_prefix, DETAILS_KEY)
 
     @classmethod
     def get_existing_prefixes(cls) -> Iterator[str]:
-        if object_list := decision_storage.all_items():
-            if filtered_list := decision_storage.filter_content(
-                filter_suffix="/{DETAILS_KEY}", objects_list=object_list
-            ):
-                for item in filtered_list:
-                    yield item["Key"]
+        return cls.prefixes_in_storage(DETAILS_KEY)
 
     def to_storage(self):
         # Uses `details.yaml` to upload decision fields represented by instance.
@@ -51,7 +46,7 @@ class DecisionHTML(DecisionFields):
         # Upload legacy html files
         if self.home_html and self.home_html.exists():
             loc = f"{self.prefix}/body.html"
-            decision_storage.upload(file_like=self.home_html, loc=loc)
+            upload_to_storage(file_like=self.home_html, loc=loc)
 
         # Upload markdown-based opinion files
         for opinion in self.opinions:
@@ -78,9 +73,9 @@ class DecisionHTML(DecisionFields):
         fallo = None
         fallo_file = folder_path / "fallo.html"
         if fallo_file.exists():
-            fallo = markdownify(fallo_file.read_text()).strip()
+            fallo = FALLO_CONVERTER.convert(fallo_file.read_text()).strip()
 
-        local = yaml.safe_load(local_path.read_bytes())
+        local = yaml.load(local_path.read_bytes(), Loader=SafeLoader)
         result = cls.get_common(local, db)
         if not result:
             return None
@@ -1,19 +1,20 @@
+import datetime
 import json
 from collections.abc import Iterator
 from concurrent.futures import TimeoutError
+from functools import lru_cache
+from operator import itemgetter
 from typing import Self
 
 from citation_utils import Citation
-from dateutil.parser import parse
 from loguru import logger
 from pebble import concurrent
 from pydantic import BaseModel, Field
 from sqlite_utils import Database
 from statute_trees import MentionedStatute
 
-from corpus_sc_toolkit.utils import sqlenv
+from corpus_sc_toolkit.utils import parse_date, sqlenv
 
-from ._resources import DECISION_BUCKET_NAME, DECISION_CLIENT, decision_storage
 from .decision_fields import DecisionFields
 from .decision_opinion_segments import OpinionSegment
 from .decision_opinions import DecisionOpinion, OpinionTag
@@ -23,6 +24,20 @@ from .justice import CandidateJustice
 PDF_KEY = "pdf.yaml"
 """This suffix is uploaded / retrieved from R2 storage based on `DecisionPDF`."""
 
+PDF_BASE_URL = "https://sc.judiciary.gov.ph"
+"""Opinion pdf paths from the sql query are relative to this url."""
+
+OPINION_SUBKEYS = ("id", "title", "body", "annex")
+"""Fields of each opinion from the sql query used in `InterimOpinion`."""
+
+get_opinion_subkeys = itemgetter(*OPINION_SUBKEYS)
+
+SETUP_KEYS = frozenset(("id", "date", "opinions"))
+"""Keys required in a row of the sql query by `InterimOpinion.setup()`."""
+
+LIMIT_EXTRACT_SQL = sqlenv.get_template("decisions/limit_extract.sql").render()
+"""The sql query takes no variables so it is rendered once on import."""
+
 
 @concurrent.process(timeout=5)
 def list_statutes(body_text: str, annex_text: str | None = None):
@@ -44,6 +59,45 @@ def list_citations(body_text: str, annex_text: str | None = None):
     return items
 
 
+CITATION_KEYS = ("docket_category", "serial", "date")
+"""Keys in a row of the sql query needed by `extract_citation_ids()`."""
+
+
+MONTH_ABBREVIATIONS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+
+def docket_date_str(date_obj: datetime.date) -> str:
+    """Same result as `strftime("%b %-d, %Y")` without the locale-dependent
+    formatter.
+
+    Examples:
+        >>> docket_date_str(datetime.date(2001, 12, 1))
+        'Dec 1, 2001'
+    """
+    month = MONTH_ABBREVIATIONS[date_obj.month - 1]
+    return f"{month} {date_obj.day}, {date_obj.year}"
+
+
+@lru_cache(maxsize=16384)
+def docket_citation(docket_str: str) -> Citation | None:
+    """The same docket string recurs across rows of the extractor database,
+    e.g. consolidated cases, so the parsed citation is cached."""
+    return Citation.extract_citation(docket_str)
+
+
 def extract_citation_ids(data: dict) -> tuple[str, str, Citation] | None:
     """Because of inconsistent data declaration in the PDF table,
     need a separate citation extractor. This oresumes existence of
@@ -53,13 +107,12 @@ def extract_citation_ids(data: dict) -> tuple[str, str, Citation] | None:
     2. serial
     3. date
     """
-    keys = ["docket_category", "serial", "date"]
-    if not all([data.get(k) for k in keys]):
+    category, serial, date = (data.get(k) for k in CITATION_KEYS)
+    if not (category and serial and date):
         return None
-    date_obj = parse(data["date"]).date()
-    docket_partial = f"{data['docket_category']} No. {data['serial']}"
-    docket_str = f"{docket_partial}, {date_obj.strftime('%b %-d, %Y')}"
-    cite = Citation.extract_citation(docket_str)
+    date_obj = parse_date(date)
+    docket_str = f"{category} No. {serial}, {docket_date_str(date_obj)}"
+    cite = docket_citation(docket_str)
     if not cite:
         return None
     decision_id = cite.prefix_db_key
@@ -100,36 +153,43 @@ class InterimOpinion(BaseModel):
 
     @property
     def row(self):
-        """Row to be used in OpinionRow table."""
-        id = f"{self.decision_id}-{self.candidate.id or self.title.lower()}"
-        text = f"{self.body}\n\n----\n\n{self.annex}"
-
-        citations = []
-        future_citations = list_citations(self.body, self.annex)  # type: ignore
-        try:
-            citations = future_citations.result()  # type: ignore
-        except TimeoutError:
-            logger.error(f"Timed out citations {self.id}")
-        except Exception:
-            logger.error(f"Could not generate citations {self.id}")
-
-        statutes = []
-        future_statutes = list_statutes(self.body, self.annex)  # type: ignore
-        try:
-            statutes = future_statutes.result()  # type: ignore
-        except TimeoutError:
-            logger.error(f"Timed out statutes {self.id}")
-        except Exception:
-            logger.error(f"Could not generate statutes {self.id}")
-
-        return DecisionOpinion(
+        """Row to be used in OpinionRow table. The justice of the candidate
+        is resolved once; the citation and statute extractors are skipped
+        when the opinion has no text to scan. The values are already typed
+        so the row is created via `construct()` without re-validation, hence
+        the explicit `str` id and the fallback for a missing body."""
+        justice_id = self.candidate.id
+        writer = str(justice_id) if justice_id else self.title.lower()
+        id = f"{self.decision_id}-{writer}"
+        body = self.body or ""
+        text = f"{body}\n\n----\n\n{self.annex}"
+
+        citations, statutes = [], []
+        if body.strip() or (self.annex or "").strip():
+            # both started before either is awaited; results kept separately
+            future_citations = list_citations(body, self.annex)
+            future_statutes = list_statutes(body, self.annex)
+            try:
+                citations = future_citations.result()  # type: ignore
+            except TimeoutError:
+                logger.error(f"Timed out citations {self.id}")
+            except Exception:
+                logger.error(f"Could not generate citations {self.id}")
+            try:
+                statutes = future_statutes.result()  # type: ignore
+            except TimeoutError:
+                logger.error(f"Timed out statutes {self.id}")
+            except Exception:
+                logger.error(f"Could not generate statutes {self.id}")
+
+        return DecisionOpinion.construct(
             id=id,
             decision_id=self.decision_id,
             title=self.title,
             pdf=self.pdf,
-            justice_id=self.candidate.id,
+            justice_id=justice_id,
             text=text,
-            tags=OpinionTag.detect(self.title),
+            tags=[tag.value for tag in OpinionTag.detect(self.title)],
             citations=citations,
             statutes=statutes,
             segments=list(
@@ -151,15 +211,24 @@ class InterimOpinion(BaseModel):
         """  # noqa: E501
         opinions = []
         match_ponencia = {}
-        prerequisite = "id" in data and "date" in data and "opinions" in data
-        if not prerequisite:
+        if not data.keys() >= SETUP_KEYS:  # one subset check, not three
             return None
-        subkeys = ["id", "title", "body", "annex"]
+        candidates: dict[tuple[str | None, str], CandidateJustice] = {}
         for op in json.loads(data["opinions"]):
-            pdf = f"https://sc.judiciary.gov.ph{op['pdf']}"
-            raw = {k: v for k, v in op.items() if k in subkeys}
-            candidate = CandidateJustice(db, op.get("writer"), data["date"])
-            opinion = cls(decision_id=idx, pdf=pdf, candidate=candidate, **raw)
+            pdf = f"{PDF_BASE_URL}{op['pdf']}"
+            op_id, title, body, annex = get_opinion_subkeys(op)
+            key = (op.get("writer"), data["date"])
+            if key not in candidates:  # opinions may share the same writer
+                candidates[key] = CandidateJustice(db, *key)
+            opinion = cls.construct(  # values come from the extractor db
+                id=op_id,
+                decision_id=idx,
+                title=title,
+                body=body,
+                annex=annex,
+                pdf=pdf,
+                candidate=candidates[key],
+            )
             if opinion.title == "Ponencia":
                 if opinion.candidate and opinion.candidate.detail:
                     match_ponencia = opinion.candidate.detail._asdict()
@@ -172,22 +241,12 @@ class DecisionPDF(DecisionFields):
 
     @classmethod
     def get_key(cls, dated_prefix: str) -> str | None:
-        """Is suffix `pdf.yaml` present in result of `cls.iter_dockets()`?"""
-        key = f"{dated_prefix}/{PDF_KEY}"
-        try:
-            DECISION_CLIENT.get_object(Bucket=DECISION_BUCKET_NAME, Key=key)
-            return key
-        except Exception:
-            return None
+        """Is suffix `pdf.yaml` present in R2 for `dated_prefix`?"""
+        return cls.key_in_storage(dated_prefix, PDF_KEY)
 
     @classmethod
     def get_existing_prefixes(cls) -> Iterator[str]:
-        if object_list := decision_storage.all_items():
-            if filtered_list := decision_storage.filter_content(
-                filter_suffix="/{PDF_KEY}", objects_list=object_list
-            ):
-                for item in filtered_list:
-                    yield item["Key"]
+        return cls.prefixes_in_storage(PDF_KEY)
 
     def to_storage(self):
         # Uses `pdf.yaml` to upload decision fields represented by instance.
@@ -209,8 +268,14 @@ class DecisionPDF(DecisionFields):
         Yields:
             Iterator[Self]: Instances of the Interim Decision.
         """  # noqa: E501
-        q = sqlenv.get_template("decisions/limit_extract.sql").render()
-        for row in db.execute_returning_dicts(q):
+        # bind per-row helpers once, outside the loop
+        set_composition = CourtComposition._setter
+        set_category = DecisionCategory.set_category
+        setup_opinions = InterimOpinion.setup
+        cursor = db.execute(LIMIT_EXTRACT_SQL)  # stream rows, not fetch all
+        cols = [c[0] for c in cursor.description]
+        for values in cursor:
+            row = dict(zip(cols, values))
             result = extract_citation_ids(row)
             if not result:
                 logger.error(
@@ -225,16 +290,14 @@ class DecisionPDF(DecisionFields):
                 origin=row["id"],
                 title=row["title"],
                 description=cite.display,
-                date=parse(row["date"]).date(),
-                date_scraped=parse(row["scraped"]).date(),
+                date=parse_date(row["date"]),
+                date_scraped=parse_date(row["scraped"]),
                 citation=cite,
-                composition=CourtComposition._setter(text=row["composition"]),
+                composition=set_composition(text=row["composition"]),
                 emails=["bot@lawsql.com"],
-                category=DecisionCategory.set_category(
-                    row.get("category"), row.get("notice")
-                ),
+                category=set_category(row.get("category"), row.get("notice")),
             )
-            opx_data = InterimOpinion.setup(idx=decision_id, db=db, data=row)
+            opx_data = setup_opinions(idx=decision_id, db=db, data=row)
             if not opx_data or not opx_data.get("opinions"):
                 logger.error(f"No opinions detected in {decision_id=}")
                 continue
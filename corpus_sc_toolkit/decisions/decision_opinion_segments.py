@@ -1,6 +1,6 @@
 import re
 from collections.abc import Iterator
-from typing import Self
+from typing import NamedTuple, Self
 
 from pydantic import BaseModel, Field
 
@@ -19,6 +19,61 @@ def standardize(text: str):
 
 single_spaced = re.compile(r"\s*\n\s*")
 double_spaced = re.compile(r"\s*\n\s*\n\s*")
+reference_line = re.compile(
+    r"""
+    ^(
+        \[\^\d+\]:| # footnote definition, see DecisionHTMLConvertMarkdown
+        \[\d+\]\s+https?:// # numbered link reference
+    )
+    """,
+    re.X,
+)
+reference_heading = re.compile(
+    r"^\#+[ \t]*(References|Sources|Footnotes)[ \t]*:?[ \t]*$", re.I
+)
+
+
+def strip_reference_tail(text: str) -> str:
+    """Footnotes and reference lists are placed at the end of an opinion;
+    remove this trailing block so that it isn't segmented.
+
+    Only the final run of reference lines (footnote definitions and their
+    indented continuations, numbered links, blank lines), together with a
+    `References` / `Sources` / `Footnotes` heading right above it, is cut.
+    A matching line followed by ordinary text is part of the body and is
+    kept, as is an annex after the `----` divider of `InterimOpinion.row`.
+
+    Examples:
+        >>> strip_reference_tail("Body.\\n\\n[^1]: Id. at 2.")
+        'Body.\\n\\n'
+        >>> strip_reference_tail("Body.\\n## Footnotes\\n[^1]: Id.\\n")
+        'Body.\\n'
+        >>> strip_reference_tail("## Sources of Law\\nbody")
+        '## Sources of Law\\nbody'
+    """
+    lines = text.splitlines(keepends=True)
+    cut = idx = len(lines)
+    while idx > 0:
+        line = lines[idx - 1]
+        if reference_line.match(line):
+            cut = idx - 1  # the tail starts at least from this line
+        elif line.strip() and not line[0].isspace():
+            break  # ordinary text, anything above is the body
+        idx -= 1
+    if cut == len(lines):
+        return text
+    head = cut
+    while head > 0 and not lines[head - 1].strip():
+        head -= 1
+    if head > 0 and reference_heading.match(lines[head - 1]):
+        cut = head - 1
+    return "".join(lines[:cut])
+
+
+class SegmentExtract(NamedTuple):
+    position: str
+    segment: str
+    char_count: int
 
 
 class OpinionSegment(BaseModel):
@@ -52,22 +107,26 @@ class OpinionSegment(BaseModel):
         fts=True,
     )
 
+    class Config:
+        copy_on_model_validation = "none"  # as nested in `DecisionOpinion`
+
     @classmethod
     def segmentize(
         cls, full_text: str, min_num_chars: int = 10
-    ) -> Iterator[dict]:
+    ) -> Iterator[SegmentExtract]:
         """Split first by double-spaced breaks `\\n\\n` and then by
         single spaced breaks `\\n` to get the position of the segment.
 
-        Will exclude footnotes and segments with less than 10 characters.
+        Will exclude footnotes (see `strip_reference_tail()`) and segments
+        with less than 10 characters.
 
         Args:
             full_text (str): The opinion to segment
 
         Yields:
-            Iterator[dict]: The partial segment data fields
+            Iterator[SegmentExtract]: The partial segment data fields
         """
-        if cleaned_text := standardize(full_text):
+        if cleaned_text := standardize(strip_reference_tail(full_text)):
             if subdivisions := double_spaced.split(cleaned_text):
                 for idx, text in enumerate(subdivisions):
                     if lines := single_spaced.split(text):
@@ -78,21 +137,29 @@ class OpinionSegment(BaseModel):
                             position = f"{idx}-{sub_idx}"
                             char_count = len(segment)
                             if char_count > min_num_chars:
-                                yield {
-                                    "position": position,
-                                    "segment": segment,
-                                    "char_count": char_count,
-                                }
+                                yield SegmentExtract(
+                                    position=position,
+                                    segment=segment,
+                                    char_count=char_count,
+                                )
 
     @classmethod
     def make_segments(
         cls, decision_id: str, opinion_id: str, text: str
     ) -> Iterator[Self]:
-        """Auto-generated segments based on the text of the opinion."""
-        for extract in cls.segmentize(text):
-            yield cls(
-                id=f"{opinion_id}-{extract['position']}",
+        """Auto-generated segments based on the text of the opinion.
+
+        Since `cls.segmentize()` already produces values of the declared
+        types, each segment is built with `construct()` straight from the
+        unpacked extract rather than re-validating hundreds of segments per
+        opinion one by one.
+        """
+        for position, segment, char_count in cls.segmentize(text):
+            yield cls.construct(
+                id=f"{opinion_id}-{position}",
                 decision_id=decision_id,
                 opinion_id=opinion_id,
-                **extract,
+                position=position,
+                segment=segment,
+                char_count=char_count,
             )
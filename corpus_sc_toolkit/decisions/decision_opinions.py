@@ -1,4 +1,5 @@
-import re
+import os
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 
@@ -7,11 +8,13 @@ from loguru import logger
 from pydantic import BaseModel, Field
 from statute_trees import MentionedStatute
 
-from ._resources import decision_storage
+from ._resources import (
+    DECISION_BUCKET_NAME,
+    DECISION_CLIENT,
+    decision_storage,
+)
 from .decision_opinion_segments import OpinionSegment
 
-OPINION_MD_H1 = re.compile(r"^#\s*(?P<label>.*)")
-
 
 class OpinionTag(str, Enum):
     ponencia = "Ponencia"
@@ -73,6 +76,7 @@ class DecisionOpinion(BaseModel):
 
     class Config:
         use_enum_values = True
+        copy_on_model_validation = "none"  # as nested in `DecisionFields`
 
     def make_filename_for_upload(self, file_ext: str = "md"):
         if file_ext not in ("md", "txt"):
@@ -98,14 +102,12 @@ class DecisionOpinion(BaseModel):
             logger.warning("Missing title, skip upload.")
             return None
 
-        temp_md = Path(__file__).parent / "_tmp" / f"temp_op.{file_ext}"
-        temp_md.write_text(self.text)
-        decision_storage.upload(
-            file_like=temp_md,
-            loc=f"{decision_prefix}/opinions/{prefix_title}",
-            args=decision_storage.set_extra_meta(self.storage_meta),
+        DECISION_CLIENT.put_object(  # the text is uploaded without a temp file
+            Bucket=DECISION_BUCKET_NAME,
+            Key=f"{decision_prefix}/opinions/{prefix_title}",
+            Body=self.text.encode("utf-8"),
+            **decision_storage.set_extra_meta(self.storage_meta),
         )
-        temp_md.unlink(missing_ok=True)
 
     @property
     def storage_meta(self):
@@ -125,13 +127,15 @@ class DecisionOpinion(BaseModel):
 
     @classmethod
     def get_headline(cls, text: str) -> str | None:
-        """Markdown contains H1 header, extract this header."""
-        if match := OPINION_MD_H1.search(text):
-            label = match.group("label")
-            if len(label) >= 5 and len(label) <= 50:
-                return label
-            else:
-                logger.error(f"Improper opinion {label=} regex capture.")
+        """Markdown contains H1 header at the start of the text, extract this
+        header."""
+        if not text.startswith("#"):
+            return None
+        first_line, _, _ = text.partition("\n")
+        label = first_line[1:].strip()
+        if len(label) >= 5 and len(label) <= 50:
+            return label
+        logger.error(f"Improper opinion {label=} headline.")
         return None
 
     @classmethod
@@ -139,7 +143,7 @@ class DecisionOpinion(BaseModel):
         """Given a prefix containing a filename, e.g. `/hello/test/ponencia.md`,
         get the identifying key of the filename, e.g. `ponencia`."""
         if "/" in prefix and prefix.endswith(".md"):
-            return prefix.split("/")[-1].split(".")[0]
+            return prefix.rpartition("/")[2].partition(".")[0] or None
         return None
 
     @classmethod
@@ -164,6 +168,10 @@ class DecisionOpinion(BaseModel):
         the <digit>.
 
         Each opinion consists of `segments`, `citations`, and `statutes`.
+
+        Since the values are produced in-process with the proper types, the
+        instance is created via `construct()` without re-validation; tags
+        are stored as values in lieu of `use_enum_values`.
         """
         key = cls.key_from_md_prefix(path)
         if not key:
@@ -179,13 +187,13 @@ class DecisionOpinion(BaseModel):
         opinion_id = (  # this matches opinion id from InterimOpinion f"{self.decision_id}-{self.candidate.id or self.id}" # noqa E501
             f"{decision_id}-{key}"
         )
-        return cls(
+        return cls.construct(
             id=opinion_id,
             decision_id=decision_id,
             title=title,
             text=text,
             justice_id=justice_id,
-            tags=OpinionTag.detect(title),
+            tags=[tag.value for tag in OpinionTag.detect(title)],
             citations=list(Citation.extract_citations(text=text)),
             statutes=list(MentionedStatute.set_counted_statute(text=text)),
             segments=list(
@@ -206,12 +214,29 @@ class DecisionOpinion(BaseModel):
     ):
         """Assumes local folder containing opinions in .md format.
         The `ponente_id`, if present, will be used to populate the ponencia
-        opinion."""
-        for opinion_path in opinions_folder.glob("**/*.md"):
-            if opinion := cls.make_opinion(
-                path=str(opinion_path),
+        opinion.
+
+        Paths are listed first so that reading and processing of each opinion
+        can be done in a thread pool; opinions are yielded in listing order
+        as soon as each is ready."""
+
+        def from_path(opinion_path: str):
+            return cls.make_opinion(
+                path=opinion_path,
                 decision_id=decision_id,
                 justice_id=ponente_id,
-                text=opinion_path.read_text(),
-            ):
-                yield opinion
+                text=Path(opinion_path).read_text(),
+            )
+
+        with os.scandir(opinions_folder) as entries:
+            paths = [
+                e.path
+                for e in entries
+                if e.name.endswith(".md") and e.is_file()
+            ]
+        if not paths:
+            return
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            for opinion in executor.map(from_path, paths):
+                if opinion:
+                    yield opinion
@@ -1,5 +1,6 @@
 import re
 from enum import Enum
+from functools import lru_cache
 
 CATEGORY_START_DECISION = re.compile(r"d\s*e\s*c", re.I)
 CATEGORY_START_RESOLUTION = re.compile(r"r\s*e\s*s", re.I)
@@ -34,6 +35,7 @@ class DecisionCategory(str, Enum):
     other = "Unspecified"
 
     @classmethod
+    @lru_cache(maxsize=128)
     def _setter(cls, text: str | None):
         """Detect pattern based on simple matching of characters.
 
@@ -54,8 +56,19 @@ class DecisionCategory(str, Enum):
 
     @classmethod
     def set_category(cls, category: str | None = None, notice: int | None = 0):
+        """A `notice` implies a minute resolution, otherwise the `category`
+        is detected through `_setter()`.
+
+        Examples:
+            >>> DecisionCategory.set_category("R E S O L U T I O N")
+            <DecisionCategory.resolution: 'Resolution'>
+            >>> DecisionCategory.set_category("Decision", notice=1)
+            <DecisionCategory.minute: 'Minute Resolution'>
+            >>> DecisionCategory.set_category(None)
+            <DecisionCategory.other: 'Unspecified'>
+        """
         if notice:
             return cls.minute
         if category:
-            cls._setter(category)
+            return cls._setter(category)
         return cls.other
@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 
 
 class CourtComposition(str, Enum):
@@ -11,6 +12,7 @@ class CourtComposition(str, Enum):
     other = "Unspecified"
 
     @classmethod
+    @lru_cache(maxsize=128)
     def _setter(cls, text: str | None):
         """Detect pattern based on simple matching of characters.
 
@@ -43,6 +43,8 @@ CHAIRPERSON = re.compile(
 multilines = re.compile(r"\s*\n+\s*")
 startlines = re.compile(r"^[\.,\s]")
 endlines = re.compile(r"\-+$")
+justice_indicator = re.compile(r"(C\.|J\.)?J\.")
+capital_start = re.compile(r"^[A-Z]")
 
 
 def voteline_clean(text: str | None) -> str | None:
@@ -57,9 +59,9 @@ def voteline_clean(text: str | None) -> str | None:
     if not text:
         return None
     text = text.lstrip(". ").rstrip()
-    init = markdownify(text).replace("*", "").strip()
-    if len(text) < VOTEFULL_MIN_LENGTH:
+    if len(text) < VOTEFULL_MIN_LENGTH:  # skip markdownify on short text
         return None
+    init = markdownify(text).replace("*", "").strip()
     clean = WHITELIST.sub("", init)
     add_concur_line = clean.replace("concur.", "concur.\n")
     unchair = CHAIRPERSON.sub("", add_concur_line)
@@ -78,17 +80,11 @@ def is_line_ok(text: str) -> bool:
     Returns:
         bool: Whether the text can be considered a voteline.
     """
-    has_proper_length = VOTELINE_MAX_LENGTH > len(text) > VOTELINE_MIN_LENGTH
-    has_indicator = re.search(r"(C\.|J\.)?J\.", text)
-    not_all_caps = not text.isupper()
-    first_char_capital_letter = re.search(r"^[A-Z]", text)
-    return all(
-        [
-            has_proper_length,
-            has_indicator,
-            not_all_caps,
-            first_char_capital_letter,
-        ]
+    return (
+        VOTELINE_MAX_LENGTH > len(text) > VOTELINE_MIN_LENGTH
+        and capital_start.search(text) is not None
+        and not text.isupper()
+        and justice_indicator.search(text) is not None
     )
 
 
@@ -6,6 +6,8 @@ import yaml
 from corpus_pax.github import gh
 from loguru import logger
 
+from corpus_sc_toolkit.utils import SafeDumper, SafeLoader
+
 from .justice_model import Justice
 
 
@@ -20,7 +22,7 @@ def get_justices_from_api() -> Iterator[dict]:
         "https://api.github.com/repos/justmars/corpus/contents/justices/sc.yaml"
     )
     if res.status_code == HTTPStatus.OK:
-        yield from yaml.safe_load(res.content)
+        yield from yaml.load(res.content, Loader=SafeLoader)
     raise Exception(f"No justice list, see {res=}")
 
 
@@ -49,12 +51,13 @@ def get_justices_file(
         return local_file
 
     with open(local_file, "w+") as writefile:
-        yaml.safe_dump(
+        yaml.dump(
             data=[
                 Justice.from_data(justice_data).dict(exclude_none=True)
                 for justice_data in get_justices_from_api()
             ],
             stream=writefile,
+            Dumper=SafeDumper,
             sort_keys=False,
             default_flow_style=False,
         )
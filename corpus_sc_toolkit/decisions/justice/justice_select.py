@@ -1,10 +1,12 @@
 import datetime
 from typing import Any, NamedTuple
+from weakref import WeakKeyDictionary
 
-from dateutil.parser import parse
 from loguru import logger
 from sqlite_utils.db import Database, Table
 
+from corpus_sc_toolkit.utils import parse_date
+
 from .justice_model import Justice
 from .justice_name import OpinionWriterName
 
@@ -26,7 +28,7 @@ class CandidateJustice(NamedTuple):
         if not self.date_str:
             return None
         try:
-            return parse(self.date_str).date()
+            return parse_date(self.date_str)
         except Exception:
             return None
 
@@ -68,20 +70,16 @@ class CandidateJustice(NamedTuple):
         Returns:
             list[dict]: Filtered list of justices
         """  # noqa: E501
-        if not self.valid_date:
+        if not (valid_date := self.valid_date):
             return []
-        criteria = "inactive_date > :date and :date > start_term"
-        params = {"date": self.valid_date.isoformat()}
-        results = self.table.rows_where(
-            where=criteria,
-            where_args=params,
-            select=(
-                "id, lower(last_name) surname, alias, start_term,"
-                " inactive_date, chief_date"
-            ),
-            order_by="start_term desc",
-        )
-        return list(results)
+        date = valid_date.isoformat()
+        return [  # copies since `choice` modifies the row selected
+            dict(row)
+            for row in get_justice_rows(self.db)
+            if row["inactive_date"]
+            and row["start_term"]
+            and row["inactive_date"] > date > row["start_term"]
+        ]
 
     @property
     def choice(self) -> dict | None:
@@ -110,16 +108,16 @@ class CandidateJustice(NamedTuple):
             >>> c.path_to_db.unlink() # tear down
         """  # noqa: E501
         opts = []
-        if not self.valid_date:
+        if not (valid_date := self.valid_date):
             return None
-        if not self.candidate:
+        if not (name := self.candidate):
             return None
 
         for candidate in self.rows:
-            if candidate["alias"] and candidate["alias"] == self.candidate:
+            if candidate["alias"] and candidate["alias"] == name:
                 opts.append(candidate)
                 continue
-            elif candidate["surname"] == self.candidate:
+            elif candidate["surname"] == name:
                 opts.append(candidate)
                 continue
         if opts:
@@ -129,15 +127,13 @@ class CandidateJustice(NamedTuple):
                 res["surname"] = res["surname"].title()
                 res["designation"] = "J."
                 if chief_date := res.get("chief_date"):
-                    s = parse(chief_date).date()
-                    e = parse(res["inactive_date"]).date()
-                    if s < self.valid_date < e:
+                    s = parse_date(chief_date)
+                    e = parse_date(res["inactive_date"])
+                    if s < valid_date < e:
                         res["designation"] = "C.J."
                 return res
             else:
-                logger.warning(
-                    f"Many {opts=} for {self.candidate=} on {self.valid_date=}"
-                )
+                logger.warning(f"Many {opts=} for {name=} on {valid_date=}")
         return None
 
     @property
@@ -162,37 +158,41 @@ class CandidateJustice(NamedTuple):
         Returns:
             JusticeDetail | None: Will subsequently be used in DecisionRow in a third-party library.
         """  # noqa: E501
-        if not self.src:
+        return get_justice_detail(self)
+
+    def find_detail(self) -> JusticeDetail | None:
+        """Uncached lookup behind `detail`, see `get_justice_detail()`."""
+        if not (src := self.src):
             return None
 
-        if self.src.per_curiam:
+        if src.per_curiam:
             return JusticeDetail(
                 justice_id=None,
                 raw_ponente=None,
                 designation=None,
                 per_curiam=True,
             )
-        elif self.choice and self.choice.get("id", None):
-            digit_id = int(self.choice["id"])
+        elif (choice := self.choice) and choice.get("id", None):
+            digit_id = int(choice["id"])
             return JusticeDetail(
                 justice_id=digit_id,
-                raw_ponente=self.choice["surname"],
-                designation=self.choice["designation"],
+                raw_ponente=choice["surname"],
+                designation=choice["designation"],
                 per_curiam=False,
             )
         return None
 
     @property
     def id(self) -> int | None:
-        return self.detail.justice_id if self.detail else None
+        return detail.justice_id if (detail := self.detail) else None
 
     @property
     def per_curiam(self) -> bool:
-        return self.detail.per_curiam if self.detail else False
+        return detail.per_curiam if (detail := self.detail) else False
 
     @property
     def raw_ponente(self) -> str | None:
-        return self.detail.raw_ponente if self.detail else None
+        return detail.raw_ponente if (detail := self.detail) else None
 
     @property
     def ponencia(self) -> dict[str, Any]:
@@ -202,8 +202,58 @@ class CandidateJustice(NamedTuple):
         2. `raw_ponente`: str
         3. `per_curiam`: bool
         """
+        detail = self.detail or JusticeDetail()
         return {
-            "justice_id": self.id,
-            "raw_ponente": self.raw_ponente,
-            "per_curiam": self.per_curiam,
+            "justice_id": detail.justice_id,
+            "raw_ponente": detail.raw_ponente,
+            "per_curiam": detail.per_curiam,
         }
+
+
+JUSTICE_ROWS: WeakKeyDictionary[Database, tuple[dict, ...]] = (
+    WeakKeyDictionary()
+)
+"""Rows of the justice table per `Database`, see `get_justice_rows()`."""
+
+JUSTICE_DETAILS: WeakKeyDictionary[
+    Database, dict[tuple[str | None, str | None], JusticeDetail | None]
+] = WeakKeyDictionary()
+"""Results of `CandidateJustice.find_detail()` per `Database`, keyed on the
+candidate's text and date string, see `get_justice_detail()`."""
+
+
+def get_justice_rows(db: Database) -> tuple[dict, ...]:
+    """Preload the justice table with a single query; the rows of each
+    `CandidateJustice` are then filtered in memory by date rather than
+    through a separate query per candidate.
+
+    The ISO date strings compare the same way as in the original sql
+    criteria, i.e. `inactive_date > :date and :date > start_term`, and
+    the order matches `start_term desc`.
+
+    The rows are held only as long as the `db` object itself, so a new
+    connection always starts from the current table.
+    """
+    if (rows := JUSTICE_ROWS.get(db)) is None:
+        rows = JUSTICE_ROWS[db] = tuple(
+            db.table(Justice.__tablename__).rows_where(
+                select=(
+                    "id, lower(last_name) surname, alias, start_term,"
+                    " inactive_date, chief_date"
+                ),
+                order_by="start_term desc, id desc",
+            )
+        )
+    return rows
+
+
+def get_justice_detail(candidate: CandidateJustice) -> JusticeDetail | None:
+    """The same writer and date recur across the opinions of a decision and
+    across decisions so the result of its lookup is kept for as long as the
+    `db` of the candidate."""
+    if (details := JUSTICE_DETAILS.get(candidate.db)) is None:
+        details = JUSTICE_DETAILS[candidate.db] = {}
+    key = (candidate.text, candidate.date_str)
+    if key not in details:
+        details[key] = candidate.find_detail()
+    return details[key]
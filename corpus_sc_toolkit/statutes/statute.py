@@ -1,8 +1,11 @@
 import sqlite3
+import tempfile
 from collections.abc import Iterator
 from pathlib import Path
-from typing import Self
+from typing import Any, Self
 
+import yaml
+from botocore.exceptions import ClientError
 from corpus_pax import Individual
 from loguru import logger
 from pydantic import BaseModel, EmailStr, Field, ValidationError
@@ -20,16 +23,30 @@ from statute_trees import (
 )
 
 from corpus_sc_toolkit.store import StorageToDatabaseConfiguration
-from corpus_sc_toolkit.utils import sqlenv
+from corpus_sc_toolkit.utils import SafeDumper, SafeLoader, sqlenv
 
 DETAILS_FILE = "details.yaml"
 STATUTE_TEMP_FOLDER = Path(__file__).parent / "_tmp"
 STATUTE_TEMP_FOLDER.mkdir(exist_ok=True)
+STATUTE_BUCKET_NAME = "ph-statutes"
 statute_storage = StorageUtils(
-    name="ph-statutes", temp_folder=STATUTE_TEMP_FOLDER
+    name=STATUTE_BUCKET_NAME, temp_folder=STATUTE_TEMP_FOLDER
 )
 
 
+def restore_yaml(key: str) -> dict[str, Any] | None:
+    """Unlike `statute_storage.restore_temp_yaml()`, read the `key` from R2
+    into memory rather than writing it to a temp file and reading it back."""
+    client = statute_storage.resource.meta.client
+    try:
+        obj = client.get_object(Bucket=STATUTE_BUCKET_NAME, Key=key)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+            return None
+        raise
+    return yaml.load(obj["Body"].read(), Loader=SafeLoader)
+
+
 class StatuteRow(Page, StatuteBase, TableConfig):
     __prefix__ = "lex"
     __tablename__ = "statutes"
@@ -43,18 +60,21 @@ class StatuteRow(Page, StatuteBase, TableConfig):
     @classmethod
     def get_id_via_catid(cls, c: Connection, cat: str, id: str) -> str | None:
         tbl = c.table(cls)
+        if not tbl.exists():
+            return None
         q = "statute_category = ? and statute_serial_id = ?"
-        rows = list(tbl.rows_where(where=q, where_args=(cat, id), select="id"))
-        idx = rows[0]["id"] if rows else None
-        return idx
+        sql = f"select id from [{tbl.name}] where {q} limit 1"
+        row = c.db.execute(sql, (cat, id)).fetchone()
+        return row[0] if row else None
 
     @classmethod
     def get_id(cls, c: Connection, pk: str) -> str | None:
         tbl = c.table(cls)
-        q = "id = ?"
-        rows = list(tbl.rows_where(where=q, where_args=(pk,), select="id"))
-        idx = rows[0]["id"] if rows else None
-        return idx
+        if not tbl.exists():
+            return None
+        sql = f"select id from [{tbl.name}] where id = ? limit 1"
+        row = c.db.execute(sql, (pk,)).fetchone()
+        return row[0] if row else None
 
 
 class StatuteTitleRow(TableConfig):
@@ -305,10 +325,23 @@ class Statute(BaseModel):
     def to_storage(self):
         loc = f"{self.prefix}/{DETAILS_FILE}"
         data = self.dict(exclude_none=True)
-        temp_file = statute_storage.make_temp_yaml_path_from_data(data)
         args = statute_storage.set_extra_meta(self.storage_meta)
-        statute_storage.upload(file_like=temp_file, loc=loc, args=args)
-        temp_file.unlink()
+        f = tempfile.NamedTemporaryFile(
+            "w", suffix=".yaml", dir=STATUTE_TEMP_FOLDER, delete=False
+        )
+        temp_file = Path(f.name)
+        try:
+            with f:  # emitted straight to the file, same output as safe_dump
+                yaml.dump(
+                    data,
+                    f,
+                    Dumper=SafeDumper,
+                    sort_keys=True,
+                    default_flow_style=False,
+                )
+            statute_storage.upload(file_like=temp_file, loc=loc, args=args)
+        finally:
+            temp_file.unlink(missing_ok=True)
 
     @classmethod
     def get(cls, prefix: str) -> Self:
@@ -321,7 +354,7 @@ class Statute(BaseModel):
         Returns:
             Self: Integrated Statute instance from R2 prefix.
         """
-        if not (data := statute_storage.restore_temp_yaml(yaml_suffix=prefix)):
+        if not (data := restore_yaml(prefix)):
             raise Exception(f"Could not originate {prefix=}")
         return cls(**data)
 
@@ -385,8 +418,10 @@ class ConfigStatutes(StorageToDatabaseConfiguration):
 
     def get_db_ids(self) -> Iterator[str]:
         table = self.conn.db[StatuteRow.__tablename__]
-        for row in table.rows_where(select="id"):
-            yield row["id"]
+        if table.exists():  # tuples from the raw cursor, no row dicts
+            sql = f"select id from [{table.name}]"
+            for (idx,) in self.conn.db.conn.execute(sql):
+                yield idx
 
     def get_r2_ids(self) -> Iterator[str]:
         if objs := self.storage.all_items():
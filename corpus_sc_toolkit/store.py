@@ -1,5 +1,7 @@
 import abc
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
 
 from loguru import logger
@@ -8,6 +10,8 @@ from sqlite_utils import Database
 from sqlpyd import Connection
 from start_sdk import StorageUtils
 
+from .utils import setup_logging
+
 
 class StorageToDatabaseConfiguration(BaseModel, abc.ABC):
     """Each flow must implement 4 functions:
@@ -76,6 +80,7 @@ def store_local_statutes_in_r2(
 ):
     from .statutes import Statute
 
+    setup_logging()
     for detail_path in path_to_statutes:
         try:
             if obj := Statute.from_page(detail_path):
@@ -93,14 +98,20 @@ def store_local_decisions_in_r2(
         "decisions/**/details.yaml"
     ),
 ):
-    from .decisions import DecisionHTML
-
+    from .decisions import DETAILS_KEY, DecisionHTML
+
+    setup_logging()
+    # one listing of the bucket instead of a request per decision
+    uploaded = {
+        key.removesuffix(f"/{DETAILS_KEY}")
+        for key in DecisionHTML.get_existing_prefixes()
+    }
     for detail_path in path_to_decisions:
         try:
             if obj := DecisionHTML.make_from_path(
                 local_path=detail_path, db=db
             ):
-                if DecisionHTML.get_key(obj.prefix):
+                if obj.prefix in uploaded:
                     logger.debug(f"Skipping: {obj.prefix=}")
                     continue
 
@@ -117,6 +128,10 @@ def store_pdf_decisions_in_r2(pdf_db: Database):
     so that these can be uploaded. Note that this will overwrite
     present fields.
 
+    Each decision (and its opinions) is uploaded in a thread pool, a batch
+    of rows at a time, so that only a bounded number of extracted rows are
+    held in memory.
+
     ```py
     from pylts import ConfigS3 # excluded from this package
     def get_pdf_db(path: Path, reset: bool = False) -> Path:
@@ -133,9 +148,15 @@ def store_pdf_decisions_in_r2(pdf_db: Database):
     """
     from .decisions import DecisionPDF
 
+    setup_logging()
     rows = DecisionPDF.originate(db=pdf_db)
-    for row in rows:
-        try:
-            row.to_storage()
-        except Exception as e:
-            logger.error(f"Bad {row.id=}; see {e=}")
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        while batch := list(islice(rows, 64)):  # bounded, rows are large
+            futures = {
+                executor.submit(row.to_storage): row.id for row in batch
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Bad {futures[future]=}; see {e=}")
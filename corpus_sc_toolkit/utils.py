@@ -1,12 +1,23 @@
+import datetime
 import re
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from corpus_pax import Individual
+from dateutil.parser import parse
 from jinja2 import Environment, PackageLoader, select_autoescape
+from loguru import logger
 from markdownify import markdownify
 from sqlpyd import Connection
 
+try:  # use libyaml bindings when available
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper, SafeLoader  # type: ignore
+
 sqlenv = Environment(
     loader=PackageLoader(
         package_name="corpus_sc_toolkit", package_path="_sql"
@@ -15,6 +26,52 @@ sqlenv = Environment(
 )
 
 
+@lru_cache(maxsize=1)
+def setup_logging():
+    """Configured once, on first use, rather than on import of the package
+    which would otherwise open the `logs/*.log` sinks for every importer."""
+    logger.configure(
+        handlers=[
+            {
+                "sink": "logs/error.log",
+                "format": "{message}",
+                "level": "ERROR",
+            },
+            {
+                "sink": "logs/warnings.log",
+                "format": "{message}",
+                "level": "WARNING",
+                "serialize": True,
+            },
+            {
+                "sink": sys.stderr,
+                "format": "{message}",
+                "level": "DEBUG",
+                "serialize": True,
+            },
+        ]
+    )
+
+
+def parse_date(text: str) -> datetime.date:
+    """Dates stored in the databases are generally ISO formatted; use the
+    fast path of `datetime.date.fromisoformat()` and only fall back to the
+    slower `dateutil` parser for other formats.
+
+    Examples:
+        >>> parse_date("2001-12-31")
+        datetime.date(2001, 12, 31)
+        >>> parse_date("2001-12-31 10:00:00")
+        datetime.date(2001, 12, 31)
+        >>> parse_date("Dec. 31, 2001")
+        datetime.date(2001, 12, 31)
+    """
+    try:
+        return datetime.date.fromisoformat(text[:10])
+    except ValueError:
+        return parse(text).date()
+
+
 def sql_get_detail(generic_tbl_name: str, generic_id: str) -> str:
     return sqlenv.get_template("base/get_detail.sql").render(
         generic_tbl=generic_tbl_name,
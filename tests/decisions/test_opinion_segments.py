@@ -0,0 +1,46 @@
+import pytest
+
+from corpus_sc_toolkit.decisions import OpinionSegment
+from corpus_sc_toolkit.decisions.decision_opinion_segments import (
+    strip_reference_tail,
+)
+
+body = "The petition is without merit and is hereby dismissed."
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        f"{body}\n\n----\n\nThe second paragraph of the ruling is kept.",
+        f"## Sources of Law\n\n{body}",
+        f"{body}\n\n# References\n\nA discussion after the heading.",
+        f"{body}\n[^1]: Id. at 2.\nThe body resumes after the footnote.",
+    ],
+)
+def test_strip_reference_tail_keeps_body(text):
+    assert strip_reference_tail(text) == text
+
+
+def test_strip_reference_tail_keeps_annex():
+    text = f"{body}\n\n----\n\nAnnex: Table of the votes cast.\n\n"
+    notes = "## Footnotes\n\n[^1]: G.R. No. 1, Jan. 1, 2000.\n[^2]: Id.\n"
+    assert strip_reference_tail(text + notes) == text
+
+
+def test_strip_reference_tail_with_continuation():
+    notes = "[^1]: Rollo, p. 1.\n    See also p. 2.\n[2] https://lawsql.com\n"
+    assert strip_reference_tail(f"{body}\n\n{notes}") == f"{body}\n\n"
+
+
+def test_segmentize_stops_at_exact_divider():
+    text = f"{body}\n\n---\n\nThe footnotes of the converted html follow."
+    segments = list(OpinionSegment.segmentize(text))
+    assert [s.segment for s in segments] == [body]
+
+
+def test_segmentize_includes_annex():
+    annex = "Annex: Table of the votes cast."
+    text = f"{body}\n\n----\n\n{annex}\n\n[^1]: Id. at 2."
+    segments = list(OpinionSegment.segmentize(text))
+    # the short divider is skipped
+    assert [s.segment for s in segments] == [body, annex]
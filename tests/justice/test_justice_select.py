@@ -187,3 +187,48 @@ def test_justice_detail_cj_designation(candidate_as_cj):
         designation="C.J.",
         per_curiam=False,
     )
+
+
+def row_ids(db, date_str: str) -> list[int]:
+    return [row["id"] for row in CandidateJustice(db, None, date_str).rows]
+
+
+@pytest.mark.parametrize(
+    "date_str, justice_id, included",
+    [
+        ("1995-10-05", 137, False),  # start_term is exclusive
+        ("1995-10-06", 137, True),
+        ("1998-11-30", 112, False),  # inactive_date is exclusive
+        ("1998-11-29", 112, True),
+    ],
+)
+def test_justice_rows_term_bounds(session, date_str, justice_id, included):
+    assert (justice_id in row_ids(session, date_str)) is included
+
+
+def test_justice_rows_order(candidate_list):
+    terms = [row["start_term"] for row in candidate_list.rows]
+    assert terms == sorted(terms, reverse=True)
+
+
+def test_justice_rows_invalid_date(session):
+    assert CandidateJustice(db=session).rows == []
+    assert CandidateJustice(db=session, date_str="not a date").rows == []
+
+
+def test_justice_rows_are_copies(candidate):
+    assert candidate.choice and "alias" not in candidate.choice
+    assert all("alias" in row for row in candidate.rows)
+
+
+@pytest.mark.parametrize(
+    "date_str, designation",
+    [
+        ("2005-12-20", "J."),  # chief_date is exclusive
+        ("2005-12-21", "C.J."),
+        ("2006-12-05", "C.J."),
+    ],
+)
+def test_justice_chief_date_bounds(session, date_str, designation):
+    choice = CandidateJustice(session, "Panganiban", date_str).choice
+    assert choice and choice["designation"] == designation